@@ -16,12 +16,22 @@ Process:
 5. Identify new discoveries not in seed file
 """
 
+import asyncio
 import csv
+import itertools
+import os
 import re
+import ssl
 import time
-import requests
-from urllib.parse import urlparse, parse_qs, urljoin
+import aiohttp
+import pandas as pd
+import xxhash
+from lxml import etree
+from lxml import html as lxml_html
+from pybloom_live import ScalableBloomFilter
+from urllib.parse import urljoin
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 #  CONFIGURATION #
@@ -33,11 +43,24 @@ STATS_FILE = "discovery_stats.txt"
 REQUEST_TIMEOUT = 20
 PAGE_SIZE = 20
 MAX_PAGES = 50
-DELAY_BETWEEN_REQUESTS = 0.3
+REQUESTS_PER_HOST_PER_SECOND = 3
+MAX_CONCURRENCY = 128            # Validation requests in flight
+HARVEST_CONCURRENCY = 64         # Harvest requests in flight
+PAGES_IN_FLIGHT = 4              # Search pages fetched at once per endpoint
+CONNECTION_LIMIT = 256           # Total open connections
+CONNECTION_LIMIT_PER_HOST = 8    # Open connections per Avature subdomain
+DNS_CACHE_TTL = 600              # Seconds a resolved hostname is reused
+VALIDATION_RANGE_BYTES = 65536   # Bytes requested when validating an endpoint
+PAGE_RANGE_BYTES = 131072        # Bytes requested per search results page
+KEEPALIVE_TIMEOUT = 30           # Seconds an idle pooled connection is kept open
+FILTER_CHUNK_SIZE = 5000        # Jobs per false-positive filtering task
+FILTER_WORKERS = None            # Filtering processes (None = one per CPU)
+SEED_FILTER_ERROR_RATE = 1e-4    # False positive rate of the seen-in-seed filter (hits are confirmed exactly)
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, br',
 }
 
 # Paths to skip (non-job pages)
@@ -48,7 +71,7 @@ SKIP_PATHS = {
 }
 
 # False positive title filters
-BLACKLIST_TITLES = {
+BLACKLIST_TITLES = frozenset({
     'email', 'linkedin', 'facebook', 'twitter', 'instagram', 'youtube',
     'share', 'tweet', 'post', 'follow', 'subscribe', 'x', 'tiktok',
     'home', 'back', 'next', 'previous', 'menu', 'search', 'filter',
@@ -60,7 +83,7 @@ BLACKLIST_TITLES = {
     'contact', 'contact us', 'about', 'about us', 'privacy', 'terms',
     'cookie', 'cookies', 'legal', 'disclaimer', 'help', 'faq', 'support',
     'close', 'cancel', 'submit', 'save', 'delete', 'edit', 'update',
-}
+})
 
 BLACKLIST_PATTERNS = [
     r'^[\W\d]+$', r'^.{1,2}$', r'^\d+$', r'^#\d+', r'@', r'^https?://', r'\.com|\.net|\.org',
@@ -71,12 +94,56 @@ BLACKLIST_URL_PATTERNS = [
     r'/Account', r'/Privacy', r'/Terms', r'/Contact', r'/About', r'share[=/]', r'social[=/]',
 ]
 
+# Compiled patterns (shared by every call)
+_JOB_HREF_RE = re.compile(r'href=["\']([^"\']*(?:JobDetail|jobId)[^"\']*)["\']', re.IGNORECASE)
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+_JOB_LINK_XPATH = etree.XPath(
+    "//a[contains(translate(@href, 'JOBDETAIL', 'jobdetail'), 'jobdetail') or contains(@href, 'jobId=')]"
+)
+_JOB_A_RE = re.compile(r'<a[^>]*href=["\']([^"\']*(?:JobDetail|[?&]jobId=\d+)[^"\']*)["\'][^>]*>([^<]*)</a>',
+                       re.IGNORECASE)
+_JOB_DETAIL_ID_RE = re.compile(r'/JobDetail/(?:[^/]+/)?(\d+)', re.IGNORECASE)
+_JOB_DETAIL_PATH_ID_RE = re.compile(r'^[^?#]*?/JobDetail/(?:[^/?#]+/)?(\d+)', re.IGNORECASE)
+_JOB_ID_PARAM_RES = [re.compile(rf'(?:^|[?&]){param}=([^&#]+)') for param in ('jobId', 'id', 'jobid')]
+_URL_HOST_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*://(?:[^@/?#]*@)?([^:/?#]*)')
+_URL_RE = re.compile(r'^(?P<scheme>https?)://(?:[^@/?#]*@)?(?P<host>[^:/?#]*)(?::\d*)?'
+                     r'(?P<path>[^?#]*)(?:\?(?P<query>[^#]*))?', re.IGNORECASE)
+_URL_ORIGIN_RE = re.compile(r'^[^:/?#]+://[^/?#]*')
+_PAGINATION_RE = re.compile(r'jobOffset=', re.IGNORECASE)
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+\d+-(\d+)/(\d+)')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_SCHEME_RE = re.compile(r'^https?://')
+# Each blacklist fused into one alternation so a job needs a single scan per field
+_BAD_TITLE_RE = re.compile('|'.join(f'(?:{p})' for p in BLACKLIST_PATTERNS), re.IGNORECASE)
+_BAD_URL_RE = re.compile('|'.join(f'(?:{p})' for p in BLACKLIST_URL_PATTERNS), re.IGNORECASE)
+
+# One TLS context for every connection, so certificates and sessions are set up once
+SSL_CONTEXT = ssl.create_default_context()
+
+# Next free request slot (time.monotonic) per host
+_HOST_NEXT_SLOT = {}
+
 
 def log(msg):
     """Print with timestamp."""
     print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
 
 
+def url_key(url):
+    """64-bit xxhash of a URL, used in place of the string in seen-sets."""
+    return xxhash.xxh64_intdigest(url.encode('utf-8'))
+
+
+def parse_url(url):
+    """Split an http(s) URL into (scheme, host, path, query). Host is lowercased, without port."""
+    match = _URL_RE.match(url)
+    if not match:
+        return '', '', '', ''
+    return (match.group('scheme').lower(), match.group('host').lower(),
+            match.group('path'), match.group('query') or '')
+
+
 # STEP 1: PARSE SEED FILE #
 
 
@@ -103,13 +170,11 @@ def extract_site_paths(urls):
     
     for url in urls:
         try:
-            parsed = urlparse(url)
-            hostname = parsed.hostname
+            _, hostname, path, _ = parse_url(url)
             if not hostname or 'avature.net' not in hostname:
                 continue
             
-            hostname = hostname.lower()
-            path = parsed.path.strip('/')
+            path = path.strip('/')
             if not path:
                 continue
             
@@ -148,74 +213,163 @@ def extract_site_paths(urls):
 
 # STEP 2: VALIDATE ENDPOINTS #
 
-def test_endpoint(base_url):
+def create_session():
+    """Create an HTTP session with pooled keep-alive connections, limited per host."""
+    connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT, limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                                     ttl_dns_cache=DNS_CACHE_TTL, keepalive_timeout=KEEPALIVE_TIMEOUT,
+                                     ssl=SSL_CONTEXT)
+    return aiohttp.ClientSession(connector=connector, headers=HEADERS)
+
+
+async def wait_for_host(url):
+    """Per-host politeness: space requests to one host 1/REQUESTS_PER_HOST_PER_SECOND apart."""
+    host = parse_url(url)[1]
+    interval = 1 / REQUESTS_PER_HOST_PER_SECOND
+    now = time.monotonic()
+    # Reserve the next free slot for this host, then wait for it
+    slot = max(now, _HOST_NEXT_SLOT.get(host, now))
+    _HOST_NEXT_SLOT[host] = slot + interval
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+def has_job_links(html):
+    """True if a (possibly cut-off) page contains at least one job link."""
+    return _JOB_HREF_RE.search(html) is not None
+
+
+def job_list_closed(html):
+    """True if a cut-off search page shows pagination after its last job link."""
+    last = None
+    for last in _JOB_HREF_RE.finditer(html):
+        pass
+    return last is not None and _PAGINATION_RE.search(html, last.end()) is not None
+
+
+def is_whole_body(content_range):
+    """True if a 206 Content-Range header shows the part is the entire page."""
+    match = _CONTENT_RANGE_RE.match(content_range or '')
+    return match is not None and int(match.group(1)) + 1 >= int(match.group(2))
+
+
+async def fetch_listing(session, url, max_bytes, enough, semaphore):
+    """Fetch the first max_bytes of a search page. Returns (html, final_url), or None if not OK.
+    
+    Servers that ignore Range answer 200 with the whole page. A 206 body that
+    was cut short is kept only if enough(html) says it has everything the
+    caller needs; otherwise the full page is fetched instead.
+    
+    Each request waits for its host slot before taking the semaphore, so a
+    busy host never holds concurrency slots that other hosts could use.
+    """
+    await wait_for_host(url)
+    async with semaphore:
+        async with session.get(url, headers={'Range': f'bytes=0-{max_bytes - 1}'}, allow_redirects=True,
+                               timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as response:
+            if response.status not in (200, 206):
+                return None
+            html = await response.text(errors='replace')
+            final_url = str(response.url)
+            truncated = response.status == 206 and not is_whole_body(response.headers.get('Content-Range'))
+    
+    if truncated and not enough(html):
+        await wait_for_host(url)
+        async with semaphore:
+            async with session.get(url, allow_redirects=True,
+                                   timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as response:
+                if response.status != 200:
+                    return None
+                html = await response.text(errors='replace')
+                final_url = str(response.url)
+    
+    return html, final_url
+
+
+async def test_endpoint(session, base_url, semaphore):
     """Quick test if an endpoint has job listings."""
     search_url = f"{base_url}/SearchJobs/"
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        if response.status_code != 200:
+        # A lower job count is harmless here, so any job link in the head will do
+        page = await fetch_listing(session, search_url, VALIDATION_RANGE_BYTES, has_job_links, semaphore)
+        if page is None:
             return False, 0
         
-        html = response.text
-        job_links = re.findall(r'href=["\']([^"\']*(?:JobDetail|jobId)[^"\']*)["\']', html, re.IGNORECASE)
+        html, final_url = page
+        job_links = {url_key(m.group(1)) for m in _JOB_HREF_RE.finditer(html)}
         
         if job_links:
-            return True, len(set(job_links))
-        if 'error' in response.url.lower():
+            return True, len(job_links)
+        if 'error' in final_url.lower():
             return False, 0
         return False, 0
-    except:
+    except Exception:
         return False, 0
 
 
-def validate_endpoints(site_paths):
+async def validate_endpoints(session, site_paths):
     """Find endpoints with active job listings."""
     log(f"Validating {len(site_paths):,} endpoints...")
     
-    live_endpoints = []
-    for i, endpoint in enumerate(site_paths):
-        has_jobs, count = test_endpoint(endpoint['base_url'])
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    checked = 0
+    live_count = 0
+    
+    async def check(session, endpoint):
+        nonlocal checked, live_count
+        has_jobs, count = await test_endpoint(session, endpoint['base_url'], semaphore)
         
         if has_jobs:
             endpoint['estimated_jobs'] = count
-            live_endpoints.append(endpoint)
+            live_count += 1
             print(f"    [✓] {endpoint['domain']}/{endpoint['site_path']} (~{count} jobs)")
         
-        if (i + 1) % 200 == 0:
-            log(f"Progress: {i+1}/{len(site_paths)}, {len(live_endpoints)} live")
-        
-        time.sleep(0.1)
+        checked += 1
+        if checked % 200 == 0:
+            log(f"Progress: {checked}/{len(site_paths)}, {live_count} live")
+        return has_jobs
+    
+    results = await asyncio.gather(*(check(session, ep) for ep in site_paths))
     
+    live_endpoints = [ep for ep, has_jobs in zip(site_paths, results) if has_jobs]
     log(f"Found {len(live_endpoints)} live endpoints with job listings")
     return live_endpoints
 
 
 # STEP 3: HARVEST JOBS# 
 
+def find_job_links(html):
+    """Yield (href, title) for every job link on a search results page."""
+    try:
+        # Bytes, since lxml rejects str input that carries an XML encoding declaration
+        tree = lxml_html.fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+    except (ValueError, etree.LxmlError):
+        # Empty or unparseable documents fall back to a single regex scan
+        for match in _JOB_A_RE.finditer(html):
+            yield match.group(1), match.group(2)
+        return
+    for a in _JOB_LINK_XPATH(tree):
+        yield a.get('href'), a.text_content()
+
+
 def extract_jobs_from_html(html, base_url):
     jobs = []
-    pattern1 = r'<a[^>]*href=["\']([^"\']*JobDetail[^"\']*)["\'][^>]*>([^<]+)</a>'
-    pattern2 = r'<a[^>]*href=["\']([^"\']*[?&]jobId=\d+[^"\']*)["\'][^>]*>([^<]*)</a>'
-    
-    all_matches = re.findall(pattern1, html, re.IGNORECASE) + re.findall(pattern2, html, re.IGNORECASE)
-    
     seen_urls = set()
-    for href, title in all_matches:
+    for href, title in find_job_links(html):
         if href.startswith('/'):
-            parsed_base = urlparse(base_url)
-            full_url = f"{parsed_base.scheme}://{parsed_base.netloc}{href}"
+            full_url = _URL_ORIGIN_RE.match(base_url).group(0) + href
         elif href.startswith('http'):
             full_url = href
         else:
             full_url = urljoin(base_url, href)
         
-        if full_url in seen_urls:
+        key = url_key(full_url)
+        if key in seen_urls:
             continue
-        seen_urls.add(full_url)
+        seen_urls.add(key)
         
-        title = re.sub(r'\s+', ' ', title.strip())
+        title = _WHITESPACE_RE.sub(' ', title.strip())
         if len(title) < 3:
-            url_parts = urlparse(full_url).path.split('/')
+            url_parts = parse_url(full_url)[2].split('/')
             for part in url_parts:
                 if len(part) > 10 and '-' in part:
                     title = part.replace('-', ' ').title()
@@ -227,59 +381,81 @@ def extract_jobs_from_html(html, base_url):
     return jobs
 
 
-def scrape_endpoint(endpoint_info):
+async def fetch_search_page(session, search_url, semaphore):
+    """Fetch one search results page. Returns None once the listing has ended."""
+    try:
+        page = await fetch_listing(session, search_url, PAGE_RANGE_BYTES, job_list_closed, semaphore)
+        if page is None or 'error' in page[1].lower():
+            return None
+        return page[0]
+    except Exception:
+        return None
+
+
+async def scrape_endpoint(session, endpoint_info, semaphore):
     """Scrape all jobs from an endpoint with pagination."""
     base_url = endpoint_info['base_url']
     all_jobs = []
-    seen_urls = set()
+    seen_urls = set()  # 64-bit xxhash of each URL
     offset = 0
     consecutive_empty = 0
-    
-    while offset < MAX_PAGES * PAGE_SIZE:
-        search_url = f"{base_url}/SearchJobs/?jobOffset={offset}"
+    max_offset = MAX_PAGES * PAGE_SIZE
+    
+    while offset < max_offset:
+        # Fetch a small window of pages at once, then walk them in order
+        offsets = range(offset, min(offset + PAGES_IN_FLIGHT * PAGE_SIZE, max_offset), PAGE_SIZE)
+        pages = await asyncio.gather(*(
+            fetch_search_page(session, f"{base_url}/SearchJobs/?jobOffset={o}", semaphore) for o in offsets
+        ))
         
-        try:
-            response = requests.get(search_url, headers=HEADERS, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-            if response.status_code != 200 or 'error' in response.url.lower():
-                break
+        for html in pages:
+            if html is None:
+                return all_jobs
             
-            page_jobs = extract_jobs_from_html(response.text, base_url)
-            new_jobs = [j for j in page_jobs if j['url'] not in seen_urls]
-            
-            for job in new_jobs:
-                seen_urls.add(job['url'])
+            new_jobs = []
+            for job in extract_jobs_from_html(html, base_url):
+                key = url_key(job['url'])
+                if key in seen_urls:
+                    continue
+                seen_urls.add(key)
                 job['source_domain'] = endpoint_info['domain']
                 job['source_path'] = endpoint_info['site_path']
+                new_jobs.append(job)
             
             if not new_jobs:
                 consecutive_empty += 1
                 if consecutive_empty >= 2:
-                    break
+                    return all_jobs
             else:
                 consecutive_empty = 0
                 all_jobs.extend(new_jobs)
-            
-            offset += PAGE_SIZE
-            time.sleep(DELAY_BETWEEN_REQUESTS)
-        except:
-            break
+        
+        offset += len(offsets) * PAGE_SIZE
     
     return all_jobs
 
 
-def harvest_all_endpoints(live_endpoints):
+async def harvest_all_endpoints(session, live_endpoints):
     """Harvest jobs from all live endpoints."""
     log(f"Harvesting jobs from {len(live_endpoints)} endpoints...")
     
-    all_jobs = []
-    for i, endpoint in enumerate(live_endpoints):
-        jobs = scrape_endpoint(endpoint)
+    semaphore = asyncio.Semaphore(HARVEST_CONCURRENCY)
+    finished = 0
+    
+    async def harvest(session, endpoint):
+        nonlocal finished
+        jobs = await scrape_endpoint(session, endpoint, semaphore)
+        
+        finished += 1
         if jobs:
-            all_jobs.extend(jobs)
-            print(f"[{i+1}/{len(live_endpoints)}] {endpoint['domain']}/{endpoint['site_path']}: {len(jobs)} jobs")
+            print(f"[{finished}/{len(live_endpoints)}] {endpoint['domain']}/{endpoint['site_path']}: {len(jobs)} jobs")
         else:
-            print(f"[{i+1}/{len(live_endpoints)}] {endpoint['domain']}/{endpoint['site_path']}: no jobs")
+            print(f"[{finished}/{len(live_endpoints)}] {endpoint['domain']}/{endpoint['site_path']}: no jobs")
+        return jobs
     
+    results = await asyncio.gather(*(harvest(session, ep) for ep in live_endpoints))
+    
+    all_jobs = [job for jobs in results for job in jobs]
     log(f"Harvested {len(all_jobs):,} total job listings")
     return all_jobs
 
@@ -288,27 +464,23 @@ def harvest_all_endpoints(live_endpoints):
 
 def normalize_title(title):
     """Normalize title for comparison."""
-    return re.sub(r'\s+', ' ', title.lower().strip())
+    return _WHITESPACE_RE.sub(' ', title.lower().strip())
 
 
 def extract_job_id(url):
     """Extract job ID for deduplication."""
-    try:
-        parsed = urlparse(url)
-        domain = parsed.hostname or ""
-        query = parse_qs(parsed.query)
-        
-        for param in ['jobId', 'id', 'jobid']:
-            if param in query:
-                return (query[param][0], domain)
-        
-        match = re.search(r'/JobDetail/(?:[^/]+/)?(\d+)', parsed.path, re.IGNORECASE)
+    _, domain, path, query = parse_url(url)
+    
+    for pattern in _JOB_ID_PARAM_RES:
+        match = pattern.search(query)
         if match:
             return (match.group(1), domain)
-        
-        return (None, domain)
-    except:
-        return (None, "")
+    
+    match = _JOB_DETAIL_ID_RE.search(path)
+    if match:
+        return (match.group(1), domain)
+    
+    return (None, domain)
 
 
 def is_false_positive(job):
@@ -322,46 +494,61 @@ def is_false_positive(job):
     if normalize_title(title) in BLACKLIST_TITLES:
         return True
     
-    for pattern in BLACKLIST_PATTERNS:
-        if re.search(pattern, title, re.IGNORECASE):
-            return True
-    
-    for pattern in BLACKLIST_URL_PATTERNS:
-        if re.search(pattern, url, re.IGNORECASE):
-            return True
+    if _BAD_TITLE_RE.search(title):
+        return True
     
-    return False
+    return _BAD_URL_RE.search(url) is not None
+
+
+def flag_false_positives(chunk):
+    """Return is_false_positive for each job in a chunk (runs in worker processes)."""
+    return [is_false_positive(job) for job in chunk]
 
 
 def clean_and_deduplicate(jobs):
     """Remove false positives and duplicates."""
-    # Filter false positives
-    filtered = [j for j in jobs if not is_false_positive(j)]
+    # Filter false positives, spread over processes when there is more than one chunk
+    workers = FILTER_WORKERS or os.cpu_count() or 1
+    if len(jobs) > FILTER_CHUNK_SIZE and workers > 1:
+        chunks = [jobs[i:i + FILTER_CHUNK_SIZE] for i in range(0, len(jobs), FILTER_CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            flags = itertools.chain.from_iterable(executor.map(flag_false_positives, chunks))
+            filtered = [j for j, is_bad in zip(jobs, flags) if not is_bad]
+    else:
+        filtered = [j for j in jobs if not is_false_positive(j)]
     log(f"After filtering false positives: {len(filtered):,} jobs")
+    if not filtered:
+        return []
     
-    # Deduplicate by job ID
-    by_id = defaultdict(list)
-    no_id = []
-    
-    for job in filtered:
-        job_id, domain = extract_job_id(job['url'])
-        if job_id:
-            by_id[(job_id, domain)].append(job)
-        else:
-            no_id.append(job)
-    
-    deduped = []
-    for key, dupes in by_id.items():
-        dupes.sort(key=lambda j: (j['url'].startswith('https'), -len(j['url'])), reverse=True)
-        deduped.append(dupes[0])
-    
-    seen_titles = set()
-    for job in no_id:
-        _, domain = extract_job_id(job['url'])
-        key = (normalize_title(job['title']), domain)
-        if key not in seen_titles:
-            seen_titles.add(key)
-            deduped.append(job)
+    df = pd.DataFrame({
+        'url': [j['url'] for j in filtered],
+        'title': [j['title'] for j in filtered],
+    })
+    urls = df['url']
+    
+    # Job ID: query parameter in priority order, then the /JobDetail/ path
+    job_id = urls.str.extract(_JOB_ID_PARAM_RES[0], expand=False)
+    for pattern in _JOB_ID_PARAM_RES[1:]:
+        job_id = job_id.fillna(urls.str.extract(pattern, expand=False))
+    df['job_id'] = job_id.fillna(urls.str.extract(_JOB_DETAIL_PATH_ID_RE, expand=False))
+    df['domain'] = urls.str.extract(_URL_HOST_RE, expand=False).fillna('').str.lower()
+    df['order'] = range(len(df))
+    
+    # Deduplicate by job ID, preferring https then the shortest URL
+    with_id = df[df['job_id'].notna()].copy()
+    with_id['https'] = with_id['url'].str.startswith('https')
+    with_id['url_len'] = with_id['url'].str.len()
+    with_id['first_seen'] = with_id.groupby(['job_id', 'domain'])['order'].transform('min')
+    by_id = (with_id.sort_values(['https', 'url_len', 'order'], ascending=[False, True, True], kind='mergesort')
+             .drop_duplicates(['job_id', 'domain'], keep='first')
+             .sort_values('first_seen'))
+    
+    # Deduplicate the rest by normalized title per domain
+    no_id = df[df['job_id'].isna()].copy()
+    no_id['title_key'] = no_id['title'].str.lower().str.strip().str.replace(_WHITESPACE_RE, ' ', regex=True)
+    no_id = no_id.drop_duplicates(['title_key', 'domain'], keep='first')
+    
+    deduped = [filtered[i] for i in by_id['order']] + [filtered[i] for i in no_id['order']]
     
     log(f"After deduplication: {len(deduped):,} unique jobs")
     return deduped
@@ -371,24 +558,35 @@ def clean_and_deduplicate(jobs):
 
 def identify_new_jobs(jobs, seed_urls):
     """Identify jobs not in the original seed file."""
-    seed_normalized = set()
-    seed_job_ids = set()
+    # Bloom filter keyed by normalized URL and "job_id|domain". A false positive
+    # would drop a new job from the output, so every hit is confirmed against
+    # the exact keys (64-bit xxhash, as in the other seen-sets)
+    seen_in_seed = ScalableBloomFilter(initial_capacity=max(len(seed_urls) * 2, 1000),
+                                       error_rate=SEED_FILTER_ERROR_RATE)
+    seed_keys = set()
+    
+    def add(key):
+        seen_in_seed.add(key)
+        seed_keys.add(url_key(key))
+    
+    def in_seed(key):
+        return key in seen_in_seed and url_key(key) in seed_keys
     
     for url in seed_urls:
-        seed_normalized.add(re.sub(r'^https?://', '', url.lower().strip()).rstrip('/'))
+        add(_SCHEME_RE.sub('', url.lower().strip()).rstrip('/'))
         job_id, domain = extract_job_id(url)
         if job_id:
-            seed_job_ids.add((job_id, domain))
+            add(f"{job_id}|{domain}")
     
     new_jobs = []
     existing_jobs = []
     
     for job in jobs:
         url = job.get('url', '')
-        normalized = re.sub(r'^https?://', '', url.lower().strip()).rstrip('/')
+        normalized = _SCHEME_RE.sub('', url.lower().strip()).rstrip('/')
         job_id, domain = extract_job_id(url)
         
-        is_existing = normalized in seed_normalized or (job_id and (job_id, domain) in seed_job_ids)
+        is_existing = in_seed(normalized) or (job_id and in_seed(f"{job_id}|{domain}"))
         
         if is_existing:
             existing_jobs.append(job)
@@ -400,6 +598,34 @@ def identify_new_jobs(jobs, seed_urls):
 
 # MAIN #
 
+def save_live_endpoints(live_endpoints):
+    """Write validated endpoints to LIVE_ENDPOINTS_FILE."""
+    with open(LIVE_ENDPOINTS_FILE, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['domain', 'site_path', 'base_url', 'estimated_jobs'])
+        for ep in live_endpoints:
+            writer.writerow([ep['domain'], ep['site_path'], ep['base_url'], ep.get('estimated_jobs', 0)])
+    log(f"Saved live endpoints to '{LIVE_ENDPOINTS_FILE}'")
+
+
+async def discover_jobs(site_paths):
+    """Validate endpoints and harvest their jobs over one pooled session."""
+    async with create_session() as session:
+        # Step 3: Validate endpoints
+        log("STEP 3: Validating endpoints...")
+        live_endpoints = await validate_endpoints(session, site_paths)
+        
+        if not live_endpoints:
+            return [], []
+        save_live_endpoints(live_endpoints)
+        
+        # Step 4: Harvest jobs
+        log("STEP 4: Harvesting job listings...")
+        raw_jobs = await harvest_all_endpoints(session, live_endpoints)
+    
+    return live_endpoints, raw_jobs
+
+
 def main():
     print("=" * 70)
     print("PHASE 1: DISCOVERY")
@@ -416,26 +642,13 @@ def main():
     log("STEP 2: Extracting site paths...")
     site_paths = extract_site_paths(seed_urls)
     
-    # Step 3: Validate endpoints
-    log("STEP 3: Validating endpoints...")
-    live_endpoints = validate_endpoints(site_paths)
+    # Steps 3-4: Validate endpoints and harvest jobs
+    live_endpoints, raw_jobs = asyncio.run(discover_jobs(site_paths))
     
     if not live_endpoints:
         log("No live endpoints found. Exiting.")
         return
     
-    # Save live endpoints
-    with open(LIVE_ENDPOINTS_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['domain', 'site_path', 'base_url', 'estimated_jobs'])
-        for ep in live_endpoints:
-            writer.writerow([ep['domain'], ep['site_path'], ep['base_url'], ep.get('estimated_jobs', 0)])
-    log(f"Saved live endpoints to '{LIVE_ENDPOINTS_FILE}'")
-    
-    # Step 4: Harvest jobs
-    log("STEP 4: Harvesting job listings...")
-    raw_jobs = harvest_all_endpoints(live_endpoints)
-    
     # Step 5: Clean and deduplicate
     log("STEP 5: Cleaning and deduplicating...")
     clean_jobs = clean_and_deduplicate(raw_jobs)
@@ -5,7 +5,7 @@ PHASE 2: EXTRACTION
 Extracts full job details from discovered job URLs.
 
 Input:  discovered_jobs.csv (from Phase 1)
-Output: jobs_full_details.csv, jobs_full_details.json
+Output: jobs_full_details.csv, jobs_full_details.parquet/
 
 Extracts:
 - Job Title
@@ -17,32 +17,157 @@ Extracts:
 - Employment Type
 """
 
+import asyncio
 import csv
-import json
+import itertools
+import os
 import re
+import ssl
 import time
-import requests
+import aiohttp
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+import xxhash
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
 from html import unescape
-from urllib.parse import urlparse
 
 # CONFIGURATION #
 INPUT_FILE = "discovered_jobs.csv"
 OUTPUT_CSV = "jobs_full_details.csv"
-OUTPUT_JSON = "jobs_full_details.json"
-PROGRESS_FILE = "extraction_progress.json"
+OUTPUT_PARQUET = "jobs_full_details.parquet"  # Directory of part files
+PROGRESS_FILE = "completed_urls.txt"
 STATS_FILE = "extraction_stats.txt"
 
 REQUEST_TIMEOUT = 20
-DELAY_BETWEEN_REQUESTS = 0.3
 MAX_RETRIES = 2
-SAVE_INTERVAL = 100  # Save progress every 100th jobs
+REQUESTS_PER_HOST_PER_SECOND = 3
+SAVE_INTERVAL = 500  # Jobs per saved Parquet part; CSV rows and progress are written with it
+BATCH_SIZE = 500     # Jobs in flight at once
+CONNECTION_LIMIT = 200
+CONNECTION_LIMIT_PER_HOST = 6
+KEEPALIVE_TIMEOUT = 30  # Seconds an idle pooled connection is kept open
+DNS_CACHE_TTL = 600     # Seconds a resolved hostname is reused
+
+CSV_FIELDS = ['title', 'url', 'apply_url', 'location', 'date_posted',
+              'department', 'employment_type', 'description_text',
+              'source_domain', 'extraction_status', 'extracted_at']
+
+PARQUET_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('url', pa.string()),
+    ('description_text', pa.large_string()),
+    ('description_html', pa.large_string()),
+    ('location', pa.string()),
+    ('date_posted', pa.string()),
+    ('department', pa.string()),
+    ('employment_type', pa.string()),
+    ('apply_url', pa.string()),
+    ('source_domain', pa.string()),
+    ('source_path', pa.string()),
+    ('extraction_status', pa.string()),
+    ('extracted_at', pa.string()),
+])
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, br',
 }
 
+# Compiled patterns (shared by every call)
+_SCRIPT_RE = re.compile(r'<script[^>]*>[\s\S]*?</script>', re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>[\s\S]*?</style>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_URL_ORIGIN_RE = re.compile(r'^[^:/?#]+://[^/?#]*')
+_URL_HOST_RE = re.compile(r'^[^:/?#]+://(?:[^@/?#]*@)?([^:/?#]*)')
+
+_LDJSON_RE = re.compile(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>([\s\S]*?)</script>', re.IGNORECASE)
+_PARAGRAPH_RE = re.compile(r'<p[^>]*>([\s\S]*?)</p>', re.IGNORECASE)
+
+_DESC_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'<div[^>]*class=["\'][^"\']*job-description[^"\']*["\'][^>]*>([\s\S]*?)</div>',
+    r'<div[^>]*class=["\'][^"\']*jobDescription[^"\']*["\'][^>]*>([\s\S]*?)</div>',
+    r'<div[^>]*class=["\'][^"\']*description[^"\']*["\'][^>]*>([\s\S]*?)</div>',
+    r'<div[^>]*class=["\'][^"\']*job-details[^"\']*["\'][^>]*>([\s\S]*?)</div>',
+    r'<div[^>]*class=["\'][^"\']*jobDetails[^"\']*["\'][^>]*>([\s\S]*?)</div>',
+    r'<div[^>]*class=["\'][^"\']*posting-description[^"\']*["\'][^>]*>([\s\S]*?)</div>',
+    r'<div[^>]*id=["\']job-description["\'][^>]*>([\s\S]*?)</div>',
+    r'<div[^>]*id=["\']jobDescription["\'][^>]*>([\s\S]*?)</div>',
+    r'<section[^>]*class=["\'][^"\']*description[^"\']*["\'][^>]*>([\s\S]*?)</section>',
+    r'<article[^>]*class=["\'][^"\']*job[^"\']*["\'][^>]*>([\s\S]*?)</article>',
+)]
+
+# Fallbacks led by a label word ("Location: ...", "Posted ...") share one keyword
+# scan (scan_labels) instead of a full pass each. The lookahead lets the engine
+# skip positions that cannot start any label.
+_LABEL_RE = re.compile(
+    r'(?=[LlOoCcPpDdTtJjEe])(?:(?P<location>Location|Office|City)|(?P<date_posted>Posted|Date|Published)'
+    r'|(?P<department>Department|Team|Division)|(?P<employment_type>Job Type|Employment|Contract))',
+    re.IGNORECASE
+)
+_LABEL_TAILS = {
+    'location': [re.compile(r'[\s:]+</?\w+[^>]*>?\s*([A-Z][^<\n]{3,50})', re.IGNORECASE)],
+    'date_posted': [re.compile(r'[\s:]+([A-Z][a-z]+ \d{1,2},? \d{4})', re.IGNORECASE),
+                    re.compile(r'[\s:]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', re.IGNORECASE)],
+    'department': [re.compile(r'[\s:]+</?\w+[^>]*>?\s*([^<\n]{3,50})', re.IGNORECASE)],
+    'employment_type': [re.compile(r'[\s:]+([^<\n]{3,30})', re.IGNORECASE)],
+}
+
+# Per-field fallbacks in priority order; (field, index) entries refer to _LABEL_TAILS
+_LOCATION_PATTERNS = [p if isinstance(p, tuple) else re.compile(p, re.IGNORECASE) for p in (
+    r'<[^>]*class=["\'][^"\']*location[^"\']*["\'][^>]*>([^<]+)',
+    r'<[^>]*itemprop=["\']jobLocation["\'][^>]*>([^<]+)',
+    ('location', 0),
+    r'"addressLocality"\s*:\s*"([^"]+)"',
+    r'"jobLocation"[^}]*"name"\s*:\s*"([^"]+)"',
+)]
+
+_DATE_PATTERNS = [p if isinstance(p, tuple) else re.compile(p, re.IGNORECASE) for p in (
+    r'<[^>]*itemprop=["\']datePosted["\'][^>]*content=["\']([^"\']+)["\']',
+    r'"datePosted"\s*:\s*"([^"]+)"',
+    ('date_posted', 0),
+    ('date_posted', 1),
+    r'(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}',
+)]
+
+_DEPT_PATTERNS = [p if isinstance(p, tuple) else re.compile(p, re.IGNORECASE) for p in (
+    r'<[^>]*class=["\'][^"\']*department[^"\']*["\'][^>]*>([^<]+)',
+    ('department', 0),
+    r'"department"\s*:\s*"([^"]+)"',
+)]
+
+_TYPE_PATTERNS = [p if isinstance(p, tuple) else re.compile(p, re.IGNORECASE) for p in (
+    r'<[^>]*itemprop=["\']employmentType["\'][^>]*>([^<]+)',
+    r'"employmentType"\s*:\s*"([^"]+)"',
+    ('employment_type', 0),
+)]
+
+_APPLY_PATTERNS = [re.compile(p) for p in (
+    r'<a[^>]*class=["\'][^"\']*apply[^"\']*["\'][^>]*href=["\']([^"\']+)["\']',
+    r'<a[^>]*href=["\']([^"\']+)["\'][^>]*class=["\'][^"\']*apply[^"\']*["\']',
+    r'<a[^>]*href=["\']([^"\']*[Aa]pply[^"\']*)["\']',
+)]
+
+# CSS selectors tried before the regex fallbacks, in priority order
+_DESC_SELECTORS = (
+    '.job-description', '#job-description', '.jobDescription', '#jobDescription',
+    '[itemprop=description]', '.posting-description',
+)
+_LOCATION_SELECTORS = ('[class*=location i]', '[itemprop=jobLocation]')
+_DATE_SELECTOR = '[itemprop=datePosted]'
+_DEPT_SELECTOR = '[class*=department i]'
+_TYPE_SELECTOR = '[itemprop=employmentType]'
+_APPLY_SELECTOR = 'a[class*=apply][href]'
+
+# One TLS context for every connection, so certificates and sessions are set up once
+SSL_CONTEXT = ssl.create_default_context()
+
+# Next free request slot (time.monotonic) per host
+_HOST_NEXT_SLOT = {}
+
 
 def log(msg):
     """Print with timestamp."""
@@ -64,36 +189,35 @@ def load_jobs(filepath):
         return []
 
 
-def load_progress():
-    """Load progress from previous run."""
-    try:
-        with open(PROGRESS_FILE, 'r') as f:
-            return json.load(f)
-    except:
-        return {'completed_urls': [], 'results': []}
+def url_key(url):
+    """64-bit xxhash of a URL, used in place of the string in seen-sets."""
+    return xxhash.xxh64_intdigest(url.encode('utf-8'))
 
 
-def save_progress(progress):
-    """Save progress for resume capability."""
-    with open(PROGRESS_FILE, 'w') as f:
-        json.dump(progress, f)
+def load_progress():
+    """Load 64-bit xxhash keys of URLs completed by a previous run."""
+    try:
+        with open(PROGRESS_FILE, 'rb') as f:
+            return {xxhash.xxh64_intdigest(url) for url in f.read().splitlines()}
+    except FileNotFoundError:
+        return set()
 
 
 def clean_html(html):
     """Remove HTML tags and clean text."""
     if not html:
         return ""
-    html = re.sub(r'<script[^>]*>[\s\S]*?</script>', '', html, flags=re.IGNORECASE)
-    html = re.sub(r'<style[^>]*>[\s\S]*?</style>', '', html, flags=re.IGNORECASE)
-    text = re.sub(r'<[^>]+>', ' ', html)
+    html = _SCRIPT_RE.sub('', html)
+    html = _STYLE_RE.sub('', html)
+    text = _TAG_RE.sub(' ', html)
     text = unescape(text)
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     return text
 
 
-def extract_job_details(url):
-    """Fetch a job detail page and extract all available information."""
-    result = {
+def new_result(url):
+    """Blank details record for a job URL."""
+    return {
         'url': url,
         'status': 'unknown',
         'description_html': '',
@@ -105,258 +229,440 @@ def extract_job_details(url):
         'apply_url': url,
         'error': None
     }
+
+
+def create_session():
+    """Create an HTTP session with pooled keep-alive connections, limited per host."""
+    connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT, limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                                     keepalive_timeout=KEEPALIVE_TIMEOUT, ttl_dns_cache=DNS_CACHE_TTL,
+                                     ssl=SSL_CONTEXT)
+    return aiohttp.ClientSession(connector=connector, headers=HEADERS)
+
+
+def url_host(url):
+    """Lowercased host of a URL ('' if it has none)."""
+    match = _URL_HOST_RE.match(url)
+    return match.group(1).lower() if match else ''
+
+
+def interleave_by_host(jobs):
+    """Reorder jobs round-robin across hosts.
     
+    Phase 1 writes jobs grouped by employer, so in file order one host's
+    rate limit would fill every in-flight slot while other hosts sit idle.
+    """
+    by_host = {}
+    for job in jobs:
+        by_host.setdefault(url_host(job['url']), []).append(job)
+    return [job for group in itertools.zip_longest(*by_host.values()) for job in group if job is not None]
+
+
+async def wait_for_host(url):
+    """Per-host politeness: space requests to one host 1/REQUESTS_PER_HOST_PER_SECOND apart."""
+    host = url_host(url)
+    interval = 1 / REQUESTS_PER_HOST_PER_SECOND
+    now = time.monotonic()
+    # Reserve the next free slot for this host, then wait for it
+    slot = max(now, _HOST_NEXT_SLOT.get(host, now))
+    _HOST_NEXT_SLOT[host] = slot + interval
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+async def fetch_html(session, url):
+    """Fetch a job detail page. Returns (html, status, error)."""
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-            
-            if response.status_code != 200:
-                result['status'] = f'http_{response.status_code}'
-                result['error'] = f"HTTP {response.status_code}"
-                return result
-            
-            html = response.text
-            result['status'] = 'success'
-            
-            # === EXTRACT JOB DESCRIPTION ===
-            desc_patterns = [
-                r'<div[^>]*class=["\'][^"\']*job-description[^"\']*["\'][^>]*>([\s\S]*?)</div>',
-                r'<div[^>]*class=["\'][^"\']*jobDescription[^"\']*["\'][^>]*>([\s\S]*?)</div>',
-                r'<div[^>]*class=["\'][^"\']*description[^"\']*["\'][^>]*>([\s\S]*?)</div>',
-                r'<div[^>]*class=["\'][^"\']*job-details[^"\']*["\'][^>]*>([\s\S]*?)</div>',
-                r'<div[^>]*class=["\'][^"\']*jobDetails[^"\']*["\'][^>]*>([\s\S]*?)</div>',
-                r'<div[^>]*class=["\'][^"\']*posting-description[^"\']*["\'][^>]*>([\s\S]*?)</div>',
-                r'<div[^>]*id=["\']job-description["\'][^>]*>([\s\S]*?)</div>',
-                r'<div[^>]*id=["\']jobDescription["\'][^>]*>([\s\S]*?)</div>',
-                r'<section[^>]*class=["\'][^"\']*description[^"\']*["\'][^>]*>([\s\S]*?)</section>',
-                r'<article[^>]*class=["\'][^"\']*job[^"\']*["\'][^>]*>([\s\S]*?)</article>',
-            ]
-            
-            for pattern in desc_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
-                if match:
-                    result['description_html'] = match.group(1).strip()
-                    result['description_text'] = clean_html(result['description_html'])
-                    if len(result['description_text']) > 50:
-                        break
-            
-            # Fallback: paragraph content
-            if len(result['description_text']) < 50:
-                paragraphs = re.findall(r'<p[^>]*>([\s\S]*?)</p>', html, re.IGNORECASE)
-                long_paragraphs = [p for p in paragraphs if len(clean_html(p)) > 100]
-                if long_paragraphs:
-                    result['description_html'] = '<p>' + '</p><p>'.join(long_paragraphs[:5]) + '</p>'
-                    result['description_text'] = clean_html(result['description_html'])
-            
-            # === EXTRACT LOCATION ===
-            location_patterns = [
-                r'<[^>]*class=["\'][^"\']*location[^"\']*["\'][^>]*>([^<]+)',
-                r'<[^>]*itemprop=["\']jobLocation["\'][^>]*>([^<]+)',
-                r'(?:Location|Office|City)[\s:]+</?\w+[^>]*>?\s*([A-Z][^<\n]{3,50})',
-                r'"addressLocality"\s*:\s*"([^"]+)"',
-                r'"jobLocation"[^}]*"name"\s*:\s*"([^"]+)"',
-            ]
-            
-            for pattern in location_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
-                if match:
-                    loc = clean_html(match.group(1)).strip()
-                    if loc and 2 < len(loc) < 100:
-                        result['location'] = loc
-                        break
-            
-            # === EXTRACT DATE POSTED ===
-            date_patterns = [
-                r'<[^>]*itemprop=["\']datePosted["\'][^>]*content=["\']([^"\']+)["\']',
-                r'"datePosted"\s*:\s*"([^"]+)"',
-                r'(?:Posted|Date|Published)[\s:]+([A-Z][a-z]+ \d{1,2},? \d{4})',
-                r'(?:Posted|Date|Published)[\s:]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}',
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
-                if match:
-                    result['date_posted'] = match.group(1).strip()
+            await wait_for_host(url)
+            async with session.get(url, allow_redirects=True,
+                                   timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as response:
+                if response.status != 200:
+                    return None, f'http_{response.status}', f"HTTP {response.status}"
+                return await response.text(errors='replace'), 'success', None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == MAX_RETRIES - 1:
+                return None, 'error', str(type(e).__name__)
+            await asyncio.sleep(2 ** attempt)
+
+    return None, 'error', None
+
+
+def node_text(node):
+    """Whitespace-normalized text content of a DOM node."""
+    return _WHITESPACE_RE.sub(' ', node.text(separator=' ')).strip()
+
+
+def find_job_posting(html):
+    """Return the schema.org JobPosting embedded as JSON-LD, or an empty dict."""
+    for match in _LDJSON_RE.finditer(html):
+        try:
+            data = orjson.loads(match.group(1))
+        except ValueError:
+            continue
+        
+        if isinstance(data, dict):
+            graph = data.get('@graph')
+            items = graph if isinstance(graph, list) else [data]
+        else:
+            items = data if isinstance(data, list) else []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            types = item.get('@type')
+            if types == 'JobPosting' or (isinstance(types, list) and 'JobPosting' in types):
+                return item
+    return {}
+
+
+def job_posting_location(posting):
+    """Location string from a JobPosting's jobLocation, if present."""
+    locations = posting.get('jobLocation')
+    if isinstance(locations, dict):
+        locations = [locations]
+    elif not isinstance(locations, list):
+        return ''
+    for place in locations:
+        if not isinstance(place, dict):
+            continue
+        address = place.get('address')
+        if isinstance(address, dict) and address.get('addressLocality'):
+            return str(address['addressLocality']).strip()
+        if place.get('name'):
+            return str(place['name']).strip()
+    return ''
+
+
+def scan_labels(html):
+    """Run the shared label scan. Returns {(field, tail index): first captured value}."""
+    found = {}
+    wanted = sum(len(tails) for tails in _LABEL_TAILS.values())
+    for match in _LABEL_RE.finditer(html):
+        field = match.lastgroup
+        for index, tail in enumerate(_LABEL_TAILS[field]):
+            if (field, index) in found:
+                continue
+            tail_match = tail.match(html, match.end())
+            if tail_match:
+                found[(field, index)] = tail_match.group(1)
+        if len(found) == wanted:
+            break
+    return found
+
+
+def first_matches(html, patterns, labels):
+    """Yield the first value captured by each fallback pattern, in priority order.
+
+    Label-led entries are read from the scan_labels result cached in labels,
+    which is filled on first use so pages that never need it skip the scan.
+    """
+    for pattern in patterns:
+        if isinstance(pattern, tuple):
+            if not labels:
+                labels.append(scan_labels(html))
+            value = labels[0].get(pattern)
+        else:
+            match = pattern.search(html)
+            value = match.group(1) if match else None
+        if value is not None:
+            yield value
+
+
+def parse_job_details(html, url):
+    """Extract all available information from a job detail page."""
+    result = new_result(url)
+    result['status'] = 'success'
+
+    # Avature pages usually embed a schema.org JobPosting; when present it
+    # supplies most fields at once and the DOM is not built at all
+    posting = find_job_posting(html)
+    tree = None if posting else LexborHTMLParser(html)
+    labels = []
+
+    if posting:
+        if isinstance(posting.get('description'), str):
+            result['description_html'] = unescape(posting['description']).strip()
+            result['description_text'] = clean_html(result['description_html'])
+        result['location'] = job_posting_location(posting)
+        if isinstance(posting.get('datePosted'), str):
+            result['date_posted'] = posting['datePosted'].strip()
+        employment_type = posting.get('employmentType')
+        if isinstance(employment_type, list):
+            employment_type = ', '.join(map(str, employment_type))
+        if employment_type:
+            result['employment_type'] = str(employment_type).strip()
+
+    # === EXTRACT JOB DESCRIPTION ===
+    if tree is not None:
+        for selector in _DESC_SELECTORS:
+            node = tree.css_first(selector)
+            if node is not None:
+                result['description_html'] = node.inner_html.strip()
+                result['description_text'] = clean_html(result['description_html'])
+                if len(result['description_text']) > 50:
                     break
-            
-            # === EXTRACT DEPARTMENT ===
-            dept_patterns = [
-                r'<[^>]*class=["\'][^"\']*department[^"\']*["\'][^>]*>([^<]+)',
-                r'(?:Department|Team|Division)[\s:]+</?\w+[^>]*>?\s*([^<\n]{3,50})',
-                r'"department"\s*:\s*"([^"]+)"',
-            ]
-            
-            for pattern in dept_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
-                if match:
-                    dept = clean_html(match.group(1)).strip()
-                    if dept and len(dept) > 2:
-                        result['department'] = dept
-                        break
-            
-            # === EXTRACT EMPLOYMENT TYPE ===
-            type_patterns = [
-                r'<[^>]*itemprop=["\']employmentType["\'][^>]*>([^<]+)',
-                r'"employmentType"\s*:\s*"([^"]+)"',
-                r'(?:Job Type|Employment|Contract)[\s:]+([^<\n]{3,30})',
-            ]
-            
-            for pattern in type_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
-                if match:
-                    result['employment_type'] = clean_html(match.group(1)).strip()
+
+    if len(result['description_text']) <= 50:
+        for pattern in _DESC_PATTERNS:
+            match = pattern.search(html)
+            if match:
+                result['description_html'] = match.group(1).strip()
+                result['description_text'] = clean_html(result['description_html'])
+                if len(result['description_text']) > 50:
                     break
-            
-            # === EXTRACT APPLY URL ===
-            apply_patterns = [
-                r'<a[^>]*class=["\'][^"\']*apply[^"\']*["\'][^>]*href=["\']([^"\']+)["\']',
-                r'<a[^>]*href=["\']([^"\']+)["\'][^>]*class=["\'][^"\']*apply[^"\']*["\']',
-                r'<a[^>]*href=["\']([^"\']*[Aa]pply[^"\']*)["\']',
-            ]
-            
-            for pattern in apply_patterns:
-                match = re.search(pattern, html)
-                if match:
-                    apply_url = match.group(1)
-                    if apply_url.startswith('/'):
-                        parsed = urlparse(url)
-                        apply_url = f"{parsed.scheme}://{parsed.netloc}{apply_url}"
-                    result['apply_url'] = apply_url
+
+    # Fallback: paragraph content
+    if len(result['description_text']) < 50:
+        paragraphs = _PARAGRAPH_RE.findall(html)
+        long_paragraphs = [p for p in paragraphs if len(clean_html(p)) > 100]
+        if long_paragraphs:
+            result['description_html'] = '<p>' + '</p><p>'.join(long_paragraphs[:5]) + '</p>'
+            result['description_text'] = clean_html(result['description_html'])
+
+    # === EXTRACT LOCATION ===
+    if tree is not None:
+        for selector in _LOCATION_SELECTORS:
+            for node in tree.css(selector):
+                loc = node_text(node)
+                if 2 < len(loc) < 100:
+                    result['location'] = loc
                     break
-            
-            return result
-            
-        except requests.exceptions.RequestException as e:
-            if attempt == MAX_RETRIES - 1:
-                result['status'] = 'error'
-                result['error'] = str(type(e).__name__)
-            time.sleep(1)
-    
+            if result['location']:
+                break
+
+    if not result['location']:
+        for value in first_matches(html, _LOCATION_PATTERNS, labels):
+            loc = clean_html(value).strip()
+            if loc and 2 < len(loc) < 100:
+                result['location'] = loc
+                break
+
+    # === EXTRACT DATE POSTED ===
+    if tree is not None:
+        node = tree.css_first(_DATE_SELECTOR)
+        if node is not None:
+            result['date_posted'] = (node.attributes.get('content') or node_text(node)).strip()
+
+    if not result['date_posted']:
+        for value in first_matches(html, _DATE_PATTERNS, labels):
+            result['date_posted'] = value.strip()
+            break
+
+    # === EXTRACT DEPARTMENT ===
+    if tree is not None:
+        for node in tree.css(_DEPT_SELECTOR):
+            dept = node_text(node)
+            if 2 < len(dept) < 100:
+                result['department'] = dept
+                break
+
+    if not result['department']:
+        for value in first_matches(html, _DEPT_PATTERNS, labels):
+            dept = clean_html(value).strip()
+            if dept and len(dept) > 2:
+                result['department'] = dept
+                break
+
+    # === EXTRACT EMPLOYMENT TYPE ===
+    if tree is not None:
+        node = tree.css_first(_TYPE_SELECTOR)
+        if node is not None:
+            result['employment_type'] = node.attributes.get('content') or node_text(node)
+
+    if not result['employment_type']:
+        for value in first_matches(html, _TYPE_PATTERNS, labels):
+            result['employment_type'] = clean_html(value).strip()
+            break
+
+    # === EXTRACT APPLY URL ===
+    apply_url = None
+    if tree is not None:
+        node = tree.css_first(_APPLY_SELECTOR)
+        if node is not None:
+            apply_url = node.attributes.get('href')
+
+    if not apply_url:
+        for pattern in _APPLY_PATTERNS:
+            match = pattern.search(html)
+            if match:
+                apply_url = match.group(1)
+                break
+
+    if apply_url:
+        if apply_url.startswith('/'):
+            origin = _URL_ORIGIN_RE.match(url)
+            apply_url = (origin.group(0) if origin else '') + apply_url
+        result['apply_url'] = apply_url
+
     return result
 
 
+async def extract_job_details(session, url):
+    """Fetch a job detail page and extract all available information."""
+    html, status, error = await fetch_html(session, url)
+    if html is None:
+        result = new_result(url)
+        result['status'] = status
+        result['error'] = error
+        return result
+    try:
+        return parse_job_details(html, url)
+    except Exception as e:
+        # One malformed page must not stop the run (and block every resume at the same job)
+        result = new_result(url)
+        result['status'] = 'parse_error'
+        result['error'] = f"{type(e).__name__}: {e}"[:100]
+        return result
+
+
+async def process_jobs(remaining, csv_file, progress_file):
+    """Extract details for all remaining jobs concurrently, streaming each to the outputs."""
+    writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+    counts = {'processed': 0, 'success': 0, 'error': 0, 'with_desc': 0, 'with_loc': 0, 'with_date': 0}
+    rows = []  # Jobs extracted since the last saved part
+
+    def save_part():
+        """Write buffered jobs as one Parquet part, then to the CSV, then mark them completed."""
+        if not rows:
+            return
+        name = f"part-{datetime.now():%Y%m%d-%H%M%S-%f}.parquet"
+        tmp_path = os.path.join(OUTPUT_PARQUET, '.' + name)
+        pq.write_table(pa.Table.from_pylist(rows, schema=PARQUET_SCHEMA), tmp_path, compression='zstd')
+        # Hidden (dot-prefixed) until complete, so readers never see a file without a footer
+        os.replace(tmp_path, os.path.join(OUTPUT_PARQUET, name))
+        writer.writerows(rows)
+        csv_file.flush()
+        progress_file.writelines(row['url'] + '\n' for row in rows)
+        progress_file.flush()
+        rows.clear()
+
+    async def process(session, job):
+        return job, await extract_job_details(session, job['url'])
+
+    try:
+        async with create_session() as session:
+            # A sliding window rather than fixed batches, so no batch waits on its slowest host
+            jobs = iter(interleave_by_host([j for j in remaining if j.get('url')]))
+            pending = {asyncio.ensure_future(process(session, job)) for job in itertools.islice(jobs, BATCH_SIZE)}
+            
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for job in itertools.islice(jobs, len(finished)):
+                    pending.add(asyncio.ensure_future(process(session, job)))
+                
+                for task in finished:
+                    job, details = task.result()
+                    url = job['url']
+                    title = job.get('title', '')
+                    
+                    # Combine data
+                    full_job = {
+                        'title': title,
+                        'url': url,
+                        'description_text': details['description_text'],
+                        'description_html': details['description_html'],
+                        'location': details['location'] or job.get('location', ''),
+                        'date_posted': details['date_posted'],
+                        'department': details['department'],
+                        'employment_type': details['employment_type'],
+                        'apply_url': details['apply_url'],
+                        'source_domain': job.get('source_domain', ''),
+                        'source_path': job.get('source_path', ''),
+                        'extraction_status': details['status'],
+                        'extracted_at': datetime.now().isoformat()
+                    }
+                    
+                    rows.append(full_job)
+                    
+                    counts['processed'] += 1
+                    counts['with_desc'] += len(full_job['description_text']) > 50
+                    counts['with_loc'] += bool(full_job['location'])
+                    counts['with_date'] += bool(full_job['date_posted'])
+                    done = counts['processed']
+                    
+                    if details['status'] == 'success':
+                        counts['success'] += 1
+                        desc_len = len(details['description_text'])
+                        print(f"[{done}/{len(remaining)}] ✓ {title[:45]}... ({desc_len} chars)")
+                    else:
+                        counts['error'] += 1
+                        print(f"[{done}/{len(remaining)}] ✗ {title[:45]}... ({details['error']})")
+                    
+                    # Save periodically; outputs go before progress, so a crash can only repeat a job
+                    if len(rows) >= SAVE_INTERVAL:
+                        save_part()
+                        log(f"Progress saved: {done:,} jobs processed")
+    finally:
+        # Rows already extracted are kept even if the run is interrupted
+        save_part()
+
+    return counts
+
+
 def main():
     print("=" * 70)
     print("PHASE 2: EXTRACTION")
     print("=" * 70)
     start_time = time.time()
-    
+
     # Load jobs
     jobs = load_jobs(INPUT_FILE)
     if not jobs:
         return
-    
+
     # Load progress
-    progress = load_progress()
-    completed_urls = set(progress.get('completed_urls', []))
-    results = progress.get('results', [])
-    
+    completed_urls = load_progress()
+
     if completed_urls:
         log(f"Resuming from {len(completed_urls):,} previously processed jobs")
-    
+
     # Filter remaining
-    remaining = [j for j in jobs if j.get('url') not in completed_urls]
+    remaining = [j for j in jobs if url_key(j.get('url') or '') not in completed_urls]
     log(f"Processing {len(remaining):,} remaining jobs...")
-    
-    success_count = 0
-    error_count = 0
-    
-    for i, job in enumerate(remaining):
-        url = job.get('url', '')
-        title = job.get('title', '')
-        
-        if not url:
-            continue
-        
-        # Extract details
-        details = extract_job_details(url)
-        
-        # Combine data
-        full_job = {
-            'title': title,
-            'url': url,
-            'description_text': details['description_text'],
-            'description_html': details['description_html'],
-            'location': details['location'] or job.get('location', ''),
-            'date_posted': details['date_posted'],
-            'department': details['department'],
-            'employment_type': details['employment_type'],
-            'apply_url': details['apply_url'],
-            'source_domain': job.get('source_domain', ''),
-            'source_path': job.get('source_path', ''),
-            'extraction_status': details['status'],
-            'extracted_at': datetime.now().isoformat()
-        }
-        
-        results.append(full_job)
-        completed_urls.add(url)
-        
-        if details['status'] == 'success':
-            success_count += 1
-            desc_len = len(details['description_text'])
-            print(f"[{i+1}/{len(remaining)}] ✓ {title[:45]}... ({desc_len} chars)")
-        else:
-            error_count += 1
-            print(f"[{i+1}/{len(remaining)}] ✗ {title[:45]}... ({details['error']})")
-        
-        # Save progress periodically
-        if (i + 1) % SAVE_INTERVAL == 0:
-            save_progress({'completed_urls': list(completed_urls), 'results': results})
-            log(f"Progress saved: {len(results):,} jobs processed")
-        
-        time.sleep(DELAY_BETWEEN_REQUESTS)
-    
+
+    # Append when resuming, otherwise start fresh outputs
+    mode = 'a' if completed_urls else 'w'
+    os.makedirs(OUTPUT_PARQUET, exist_ok=True)
+    for name in os.listdir(OUTPUT_PARQUET):
+        # Unfinished parts from a killed run are always dropped; their jobs were never marked done
+        if name.endswith('.parquet') and (mode == 'w' or name.startswith('.')):
+            os.remove(os.path.join(OUTPUT_PARQUET, name))
+
+    with open(OUTPUT_CSV, mode, newline='', encoding='utf-8') as csv_file, \
+            open(PROGRESS_FILE, mode, encoding='utf-8') as progress_file:
+        if mode == 'w':
+            csv.writer(csv_file).writerow(CSV_FIELDS)
+        counts = asyncio.run(process_jobs(remaining, csv_file, progress_file))
+
     elapsed = time.time() - start_time
-    
-    # Save final results
-    log("Saving final results...")
-    
-    # CSV
-    with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['title', 'url', 'apply_url', 'location', 'date_posted', 
-                     'department', 'employment_type', 'description_text',
-                     'source_domain', 'extraction_status', 'extracted_at']
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        for job in results:
-            writer.writerow(job)
-    
-    # JSON
-    with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    
+    processed = counts['processed'] or 1
+
     # Statistics
-    jobs_with_desc = len([j for j in results if len(j.get('description_text', '')) > 50])
-    jobs_with_loc = len([j for j in results if j.get('location')])
-    jobs_with_date = len([j for j in results if j.get('date_posted')])
-    
     stats = f"""
 {'='*70}
 PHASE 2: EXTRACTION COMPLETE
 {'='*70}
 
 Time elapsed:           {elapsed/60:.1f} minutes
-Total jobs processed:   {len(results):,}
-Successful extractions: {success_count:,}
-Errors:                 {error_count:,}
+Jobs processed (run):   {counts['processed']:,}
+Successful extractions: {counts['success']:,}
+Errors:                 {counts['error']:,}
 
 Field Coverage:
-  Job descriptions:     {jobs_with_desc:,} ({jobs_with_desc/len(results)*100:.1f}%)
-  Locations:            {jobs_with_loc:,} ({jobs_with_loc/len(results)*100:.1f}%)
-  Dates posted:         {jobs_with_date:,} ({jobs_with_date/len(results)*100:.1f}%)
+  Job descriptions:     {counts['with_desc']:,} ({counts['with_desc']/processed*100:.1f}%)
+  Locations:            {counts['with_loc']:,} ({counts['with_loc']/processed*100:.1f}%)
+  Dates posted:         {counts['with_date']:,} ({counts['with_date']/processed*100:.1f}%)
 
 Output Files:
   {OUTPUT_CSV}
-  {OUTPUT_JSON}
+  {OUTPUT_PARQUET}/
 {'='*70}
 """
     print(stats)
-    
+
     with open(STATS_FILE, 'w') as f:
         f.write(stats)
-    
-    log(f"Saved {len(results):,} jobs to '{OUTPUT_CSV}' and '{OUTPUT_JSON}'")
+
+    log(f"Saved {counts['processed']:,} jobs to '{OUTPUT_CSV}' and '{OUTPUT_PARQUET}/'")
 
 
 if __name__ == "__main__":